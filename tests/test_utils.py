@@ -25,7 +25,8 @@ DEALINGS IN THE SOFTWARE.
 # mypy: implicit-reexport=True
 import datetime
 import random
-from inspect import signature
+from inspect import iscoroutine, signature
+from types import SimpleNamespace
 from typing import TypeVar, Tuple, Any
 
 import pytest
@@ -96,50 +97,58 @@ def test_temporary():
 #     assert t.foo == 1
 #
 #
+# class Obj:
+#     def __init__(self, value: int):
+#         self.value = value
+#         self.deep = self
+#
+#     def __eq__(self, other: Any) -> bool:
+#         return isinstance(other, self.__class__) and self.value == other.value
+#
+#     def __repr__(self) -> str:
+#         return f'<Obj {self.value}>'
+#
+#
+# OBJ_LIST = [Obj(i) for i in range(10)]
+#
+#
 # def test_find_get() -> None:
-#     class Obj:
-#         def __init__(self, value: int):
-#             self.value = value
-#             self.deep = self
-#
-#         def __eq__(self, other: Any) -> bool:
-#             return isinstance(other, self.__class__) and self.value == other.value
-#
-#         def __repr__(self) -> str:
-#             return f'<Obj {self.value}>'
-#
-#     obj_list = [Obj(i) for i in range(10)]
-#     for i in range(11):
-#         for val in (
-#                 find(lambda o: o.value == i, obj_list),
-#                 get(obj_list, value=i),
-#                 get(obj_list, deep__value=i),
-#                 get(obj_list, value=i, deep__value=i),
-#         ):
-#             if i >= len(obj_list):
-#                 assert val is None
-#             else:
-#                 assert val == Obj(i)
+#     for obj in OBJ_LIST:
+#         assert find(lambda o: o.value == obj.value, OBJ_LIST) is obj
+#         assert get(OBJ_LIST, value=obj.value) is obj
+#         assert get(OBJ_LIST, deep__value=obj.value) is obj
+#         assert get(OBJ_LIST, value=obj.value, deep__value=obj.value) is obj
+#
+#     missing = len(OBJ_LIST)
+#     assert find(lambda o: o.value == missing, OBJ_LIST) is None
+#     assert get(OBJ_LIST, value=missing) is None
+#     assert get(OBJ_LIST, deep__value=missing) is None
+#     assert get(OBJ_LIST, value=missing, deep__value=missing) is None
 #
 #
 # def test_unique() -> None:
-#     values = [random.randint(0, 100) for _ in range(1000)]
+#     values = random.Random(0).choices(range(101), k=1000)
 #     unique = _unique(values)
 #     unique.sort()
 #     assert unique == list(set(values))
 #
 #
+# @pytest.fixture(scope='module')
+# def now() -> datetime.datetime:
+#     return utcnow()
+#
+#
 # @pytest.mark.parametrize('use_clock', (True, False))
-# @pytest.mark.parametrize('value', list(range(0, 100, random.randrange(5, 10))))
-# def test_parse_ratelimit_header(use_clock, value):  # type: ignore[no-untyped-def]
-#     class RatelimitRequest:
-#         def __init__(self, reset_after: int):
-#             self.headers = {
-#                 'X-Ratelimit-Reset-After': reset_after,
-#                 'X-Ratelimit-Reset': (utcnow() + datetime.timedelta(seconds=reset_after)).timestamp(),
-#             }
+# @pytest.mark.parametrize('value', list(range(0, 100, 7)))
+# def test_parse_ratelimit_header(use_clock, value, now):  # type: ignore[no-untyped-def]
+#     request = SimpleNamespace(
+#         headers={
+#             'X-Ratelimit-Reset-After': value,
+#             'X-Ratelimit-Reset': (now + datetime.timedelta(seconds=value)).timestamp(),
+#         }
+#     )
 #
-#     assert round(_parse_ratelimit_header(RatelimitRequest(value), use_clock=use_clock)) == value
+#     assert round(_parse_ratelimit_header(request, use_clock=use_clock)) == value
 #
 #
 # @pytest.mark.parametrize('value', range(5))
@@ -149,14 +158,14 @@ def test_temporary():
 #
 #
 # @pytest.mark.parametrize('size', list(range(10, 20)))
-# @pytest.mark.filterwarnings("ignore:coroutine 'coroutine' was never awaited")
 # async def test_async_all(size) -> None:  # type: ignore[no-untyped-def]
-#     values = []
-#     raw_values = []
-#
-#     for i in range(size):
-#         value = random.choices((True, False), (size - 1, 1))[0]
-#         raw_values.append(value)
-#         values.append(coroutine(value) if random.choice((True, False)) else value)
+#     rng = random.Random(size)
+#     raw_values = rng.choices((True, False), (size - 1, 1), k=size)
+#     wrap = rng.choices((True, False), k=size)
+#     values = [coroutine(value) if w else value for value, w in zip(raw_values, wrap)]
 #
 #     assert all(raw_values) == await async_all(values)
+#
+#     for value in values:
+#         if iscoroutine(value):
+#             value.close()